@@ -1,3 +1,7 @@
+# Standard library imports
+import collections
+
+# Third-party imports
 import pytest
 
 # Local imports
@@ -37,6 +41,9 @@ class ArgumentTestCase(object):
     def test_is_static(self):
         assert self.type_cls._can_be_static == self.expected_can_be_static
 
+    def test_uses_slots(self):
+        assert not hasattr(self.type_cls(), "__dict__")
+
     def test_static_call(self, mocker, request_definition_builder):
         request_definition_builder = self.type_cls(request_definition_builder)
         builder = request_definition_builder.argument_handler_builder
@@ -73,6 +80,15 @@ class TestArgumentAnnotationHandlerBuilder(object):
         builder = arguments.ArgumentAnnotationHandlerBuilder(None, args, False)
         assert list(builder.missing_arguments) == args
 
+    @inject_args
+    def test_add_annotation_while_iterating_missing_arguments(
+        self, argument_mock, args
+    ):
+        builder = arguments.ArgumentAnnotationHandlerBuilder(None, args, False)
+        for name in builder.missing_arguments:
+            builder.add_annotation(argument_mock, name)
+        assert builder.is_done()
+
     @inject_args
     def test_remaining_args_count(self, args):
         builder = arguments.ArgumentAnnotationHandlerBuilder(None, args, False)
@@ -94,6 +110,23 @@ class TestArgumentAnnotationHandlerBuilder(object):
         builder.listener.assert_called_with(argument_mock)
         assert args[-1] not in builder.missing_arguments
 
+    @inject_args
+    def test_add_annotation_without_name_after_named(self, argument_mock, args):
+        builder = arguments.ArgumentAnnotationHandlerBuilder(None, args, False)
+        builder.add_annotation(argument_mock, name=args[0])
+        builder.add_annotation(argument_mock, name=args[2])
+        builder.add_annotation(argument_mock)
+        assert list(builder.missing_arguments) == []
+        assert builder.is_done()
+
+    @inject_args
+    def test_add_annotation_twice_with_same_name(self, argument_mock, args):
+        builder = arguments.ArgumentAnnotationHandlerBuilder(None, args, False)
+        builder.add_annotation(argument_mock, name=args[1])
+        builder.add_annotation(argument_mock, name=args[1])
+        assert builder.remaining_args_count == len(args) - 1
+        assert list(builder.missing_arguments) == [args[0], args[2]]
+
     @inject_args
     def test_add_named_annotation_without_name(
         self, mocker, named_argument_mock, args
@@ -166,34 +199,83 @@ class TestArgumentAnnotationHandlerBuilder(object):
         builder.add_annotation(argument_mock)
         assert builder.is_done()
 
+    def test_build_preserves_argument_order(self):
+        def dummy(self, arg3, arg1, arg2):
+            pass
+
+        builder = arguments.ArgumentAnnotationHandlerBuilder(
+            dummy, ["self", "arg3", "arg1", "arg2"]
+        )
+        annotations = [arguments.Query() for _ in range(3)]
+        builder.set_annotations(
+            arg2=annotations[2], arg1=annotations[1], arg3=annotations[0]
+        )
+        assert list(builder.build().annotations) == annotations
+
 
 class TestArgumentAnnotationHandler(object):
-    def test_get_relevant_arguments(self):
-        args = {"arg1": "value1"}
-        annotation_handler = arguments.ArgumentAnnotationHandler(None, args)
-        relevant = annotation_handler.get_relevant_arguments(args)
-        assert list(relevant) == list(args.items())
+    def test_handle_call_args(self, request_builder, mocker):
+        def dummy(self, arg1, arg2):
+            return arg1, arg2
+
+        annotation1 = mocker.Mock(arguments.ArgumentAnnotation)
+        annotation2 = mocker.Mock(arguments.ArgumentAnnotation)
+        handlers = arguments.ArgumentAnnotationHandler(
+            dummy, {"arg1": annotation1, "arg2": annotation2}
+        )
+        handlers.handle_call_args(request_builder, {"arg1": None})
+        annotation1.modify_request.assert_called_with(request_builder, None)
+        assert not annotation2.modify_request.called
+
+    def test_get_call_args(self):
+        def dummy(self, arg1, arg2="default"):
+            return arg1, arg2
+
+        handler = arguments.ArgumentAnnotationHandler(dummy, {})
+        call_args = handler.get_call_args(None, "hello")
+        assert call_args == {"self": None, "arg1": "hello", "arg2": "default"}
 
     def test_handle_call(self, request_builder, mocker):
-        def dummy(arg1):
+        def dummy(self, arg1):
             return arg1
 
-        request_builder.get_converter.return_value = dummy
-        get_call_args = mocker.patch("uplink.utils.get_call_args")
-        get_call_args.return_value = {"arg1": "hello"}
+        request_builder.get_converter.return_value = lambda x: x
         annotation = mocker.Mock(arguments.ArgumentAnnotation)
         handlers = arguments.ArgumentAnnotationHandler(
             dummy, {"arg1": annotation}
         )
-        handlers.handle_call(request_builder, (), {})
+        handlers.handle_call(request_builder, ("hello",), {})
         annotation.modify_request.assert_called_with(request_builder, "hello")
 
+    def test_handle_call_with_keyword_and_default(
+        self, request_builder, mocker
+    ):
+        def dummy(self, arg1, arg2="default"):
+            return arg1, arg2
+
+        annotation1 = mocker.Mock(arguments.ArgumentAnnotation)
+        annotation2 = mocker.Mock(arguments.ArgumentAnnotation)
+        handlers = arguments.ArgumentAnnotationHandler(
+            dummy, {"arg1": annotation1, "arg2": annotation2}
+        )
+        handlers.handle_call(request_builder, (), {"arg1": "hello"})
+        annotation1.modify_request.assert_called_with(request_builder, "hello")
+        annotation2.modify_request.assert_called_with(
+            request_builder, "default"
+        )
+
     @inject_args
-    def test_annotations(self, args):
-        annotations = ["annotation"] * len(args)
+    def test_annotations(self, mocker, args):
+        def dummy(self, *args):
+            return args
+
+        annotation = mocker.Mock(spec=arguments.ArgumentAnnotation)
+        annotations = [annotation] * len(args)
         arg_dict = dict(zip(args, annotations))
-        annotation_handler = arguments.ArgumentAnnotationHandler(None, arg_dict)
-        assert list(annotation_handler.annotations) == annotations
+        annotation_handler = arguments.ArgumentAnnotationHandler(
+            dummy, arg_dict
+        )
+        assert annotation_handler.annotations == tuple(annotations)
 
 
 class TestArgumentAnnotation(object):
@@ -204,6 +286,33 @@ class TestArgumentAnnotation(object):
         handler_builder.add_annotation.assert_called_with(annotation)
         assert return_value is request_definition_builder
 
+    def test_modify_request_caches_converter(self, mocker, request_builder):
+        annotation = arguments.Header("name")
+        annotation.modify_request(request_builder, "value1")
+        annotation.modify_request(request_builder, "value2")
+        assert request_builder.get_converter.call_count == 1
+        assert request_builder.info["headers"] == {"name": "value2"}
+
+        # A different registry should trigger a new lookup.
+        request_builder.converter_registry = mocker.Mock()
+        annotation.modify_request(request_builder, "value3")
+        assert request_builder.get_converter.call_count == 2
+
+    def test_modify_request_without_chained_init(self, request_builder):
+        class Custom(arguments.ArgumentAnnotation):
+            def __init__(self):
+                pass
+
+            @property
+            def converter_key(self):
+                return keys.CONVERT_TO_STRING
+
+            def _modify_request(self, request_builder, value):
+                request_builder.info["custom"] = value
+
+        Custom().modify_request(request_builder, "value")
+        assert request_builder.info["custom"] == "value"
+
 
 class TestTypedArgument(object):
     def test_type(self):
@@ -231,6 +340,13 @@ class TestNamedArgument(object):
         annotation.name = "name"
         assert annotation.name == "name"
 
+    def test_name_is_interned(self):
+        expected = arguments.NamedArgument("name").name
+        assert arguments.NamedArgument("".join(["na", "me"])).name is expected
+        annotation = arguments.NamedArgument()
+        annotation.name = "".join(["na", "me"])
+        assert annotation.name is expected
+
     def test_set_name_with_name_already_set(self):
         annotation = arguments.NamedArgument("name")
         with pytest.raises(AttributeError):
@@ -331,6 +447,21 @@ class TestHeader(ArgumentTestCase, FuncDecoratorTestCase):
         arguments.Header("hello").modify_request(request_builder, None)
         assert request_builder.info["headers"] == {}
 
+    def test_modify_request_with_name_set_later(self, request_builder):
+        header = arguments.Header()
+        header.name = "hello"
+        header.modify_request(request_builder, "world")
+        assert request_builder.info["headers"] == {"hello": "world"}
+
+    def test_modify_request_without_chained_init(self, request_builder):
+        class ApiKey(arguments.Header):
+            def __init__(self):
+                self._arg_name = "X-Key"
+                self._type = None
+
+        ApiKey().modify_request(request_builder, "secret")
+        assert request_builder.info["headers"] == {"X-Key": "secret"}
+
 
 class TestHeaderMap(ArgumentTestCase, FuncDecoratorTestCase):
     type_cls = arguments.HeaderMap
@@ -356,6 +487,11 @@ class TestField(ArgumentTestCase):
         with pytest.raises(arguments.Field.FieldAssignmentFailed):
             arguments.Field("hello").modify_request(request_builder, "world")
 
+    def test_modify_request_with_mapping_body(self, request_builder):
+        request_builder.info["data"] = collections.OrderedDict()
+        arguments.Field("hello").modify_request(request_builder, "world")
+        assert request_builder.info["data"] == {"hello": "world"}
+
 
 class TestFieldMap(ArgumentTestCase):
     type_cls = arguments.FieldMap
@@ -370,6 +506,11 @@ class TestFieldMap(ArgumentTestCase):
         with pytest.raises(arguments.FieldMap.FieldMapUpdateFailed):
             arguments.FieldMap().modify_request(request_builder, {})
 
+    def test_modify_request_with_mapping_body(self, request_builder):
+        request_builder.info["data"] = collections.OrderedDict()
+        arguments.FieldMap().modify_request(request_builder, {"hello": "world"})
+        assert request_builder.info["data"] == {"hello": "world"}
+
 
 class TestPart(ArgumentTestCase):
     type_cls = arguments.Part
@@ -379,6 +520,12 @@ class TestPart(ArgumentTestCase):
         arguments.Part("hello").modify_request(request_builder, "world")
         assert request_builder.info["files"] == {"hello": "world"}
 
+    def test_modify_request_with_name_set_later(self, request_builder):
+        part = arguments.Part()
+        part.name = "hello"
+        part.modify_request(request_builder, "world")
+        assert request_builder.info["files"] == {"hello": "world"}
+
 
 class TestPartMap(ArgumentTestCase):
     type_cls = arguments.PartMap
@@ -177,9 +177,12 @@ class TestRequestDefinitionBuilder(object):
 
         # Verify
         builder.build()
-        argument_handler_builder.set_annotations.assert_called_with(
-            {"arg1": arguments.Path}
+        argument_handler_builder.add_annotation.assert_called_with(
+            mocker.ANY, "arg1"
         )
+        annotation = argument_handler_builder.add_annotation.call_args[0][0]
+        assert isinstance(annotation, arguments.Path)
+        assert annotation.name == "arg1"
 
     def test_auto_fill_when_not_done_fails(
         self, mocker, annotation_handler_builder_mock
@@ -242,3 +245,19 @@ class TestRequestDefinition(object):
         annotation_handler_mock.annotations = ("annotation",)
         registry = definition.make_converter_registry(())
         assert isinstance(registry, converters.ConverterFactoryRegistry)
+
+    def test_make_converter_registry_reuses_registry(
+        self, annotation_handler_mock, converter_factory_mock
+    ):
+        definition = commands.RequestDefinition(
+            "method",
+            "uri",
+            None,
+            annotation_handler_mock,
+            annotation_handler_mock,
+        )
+        registry = definition.make_converter_registry([converter_factory_mock])
+        assert registry is definition.make_converter_registry(
+            [converter_factory_mock]
+        )
+        assert registry is not definition.make_converter_registry(())
@@ -57,6 +57,18 @@ class TestRequestBuilder(object):
         # Verify
         assert builder.context["key"] == "value"
 
+    def test_info(self):
+        # Setup
+        builder = helpers.RequestBuilder(None, {}, "base_url")
+
+        # Run
+        builder.info["headers"]["key"] = "value"
+
+        # Verify
+        assert builder.info == {"headers": {"key": "value"}}
+        with pytest.raises(AttributeError):
+            builder.info = {}
+
     def test_relative_url_template(self):
         # Setup
         builder = helpers.RequestBuilder(None, {}, "base_url")
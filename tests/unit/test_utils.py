@@ -1,6 +1,10 @@
 # Standard library imports
+import collections
 import sys
 
+# Third-party imports
+import pytest
+
 # Local imports
 from uplink import utils
 
@@ -29,6 +33,50 @@ def test_call_args():
     assert call_args == {"pos1": 1, "args": (2,), "kwargs": {"named": 3}}
 
 
+def test_call_args_binder():
+    def func(pos1, pos2=2, *args, **kwargs):
+        pass
+
+    get_call_args = utils.call_args_binder(func)
+    assert get_call_args(1) == {"pos1": 1, "pos2": 2, "args": (), "kwargs": {}}
+    assert get_call_args(1, pos2=3, named=4) == {
+        "pos1": 1,
+        "pos2": 3,
+        "args": (),
+        "kwargs": {"named": 4},
+    }
+
+
+def test_call_args_binder_creates_new_var_keyword_dict():
+    def func(**kwargs):
+        pass
+
+    get_call_args = utils.call_args_binder(func)
+    get_call_args()["kwargs"]["leak"] = 1
+    assert get_call_args() == {"kwargs": {}}
+
+
+def test_call_args_binder_with_positional_parameters():
+    def func(pos1, pos2, pos3=3):
+        pass
+
+    get_call_args = utils.call_args_binder(func)
+    assert get_call_args(1, 2) == {"pos1": 1, "pos2": 2, "pos3": 3}
+    assert get_call_args(1, pos3=4, pos2=2) == {"pos1": 1, "pos2": 2, "pos3": 4}
+    if not is_py2:
+        call_args = get_call_args(1, pos3=4, pos2=2)
+        assert isinstance(call_args, collections.OrderedDict)
+        assert list(call_args) == ["pos1", "pos2", "pos3"]
+    with pytest.raises(TypeError):
+        get_call_args(1)
+    with pytest.raises(TypeError):
+        get_call_args(1, 2, 3, 4)
+    with pytest.raises(TypeError):
+        get_call_args(1, 2, pos1=1)
+    with pytest.raises(TypeError):
+        get_call_args(1, 2, unknown=1)
+
+
 class TestURIBuilder(object):
     def test_variables_not_string(self):
         assert utils.URIBuilder.variables(None) == set()
@@ -8,7 +8,7 @@ import functools
 import inspect
 
 # Local imports
-from uplink import exceptions, hooks, interfaces, utils
+from uplink import compat, exceptions, hooks, interfaces, utils
 from uplink.converters import keys
 
 __all__ = [
@@ -28,6 +28,28 @@ __all__ = [
 ]
 
 
+_MISSING = object()
+
+# Check for `dict` first, as it is cheaper than the ABC instance check.
+_MAPPING_TYPES = (dict, compat.collections_abc.Mapping)
+
+
+def _intern(name):
+    # Interned names let dict lookups match keys by identity.
+    try:
+        return compat.intern(name)
+    except TypeError:
+        # e.g., `None`, or a `unicode` name on Python 2.7
+        return name
+
+
+def _make_info_setter(key, name):
+    def set_info(request_builder, value):
+        request_builder.info[key][name] = value
+
+    return set_info
+
+
 class ExhaustedArguments(exceptions.AnnotationError):
     message = (
         "Failed to add `%s` to method `%s`, as all arguments have "
@@ -59,22 +81,24 @@ class ArgumentAnnotationHandlerBuilder(interfaces.AnnotationHandlerBuilder):
 
     def __init__(self, func, arguments, func_is_method=True):
         self._arguments = arguments[func_is_method:]
-        self._annotations = collections.OrderedDict.fromkeys(self._arguments)
-        self._defined = 0
+        self._annotations = dict.fromkeys(self._arguments)
+        self._missing = collections.deque(self._arguments)
         self._func = func
         self._argument_types = {}
 
     @property
     def missing_arguments(self):
-        return (a for a in self._arguments if self._annotations[a] is None)
+        # Iterate over a snapshot, so callers can add annotations while
+        # iterating over the missing arguments.
+        return iter(tuple(self._missing))
 
     @property
     def remaining_args_count(self):
-        return len(self._arguments) - self._defined
+        return len(self._missing)
 
     def set_annotations(self, annotations=None, **more_annotations):
         if annotations is not None:
-            if not isinstance(annotations, collections.Mapping):
+            if not isinstance(annotations, _MAPPING_TYPES):
                 missing = tuple(
                     a
                     for a in self.missing_arguments
@@ -97,20 +121,23 @@ class ArgumentAnnotationHandlerBuilder(interfaces.AnnotationHandlerBuilder):
             self._argument_types[name] = annotation
 
     def _add_annotation(self, annotation, name=None):
-        try:
-            name = next(self.missing_arguments) if name is None else name
-        except StopIteration:
-            raise ExhaustedArguments(annotation, self._func)
-        if name not in self._annotations:
+        if name is None:
+            try:
+                name = self._missing[0]
+            except IndexError:
+                raise ExhaustedArguments(annotation, self._func)
+        elif name not in self._annotations:
+            # Only user-supplied names need to be validated.
             raise ArgumentNotFound(name, self._func)
         annotation = self._process_annotation(name, annotation)
         super(ArgumentAnnotationHandlerBuilder, self).add_annotation(annotation)
-        self._defined += self._annotations[name] is None
+        if self._annotations[name] is None:
+            self._missing.remove(name)
         self._annotations[name] = annotation
         return annotation
 
     def _process_annotation(self, name, annotation):
-        if inspect.isclass(annotation):
+        if isinstance(annotation, type):
             annotation = annotation()
         if isinstance(annotation, TypedArgument) and annotation.type is None:
             annotation.type = self._argument_types.pop(name, None)
@@ -119,15 +146,17 @@ class ArgumentAnnotationHandlerBuilder(interfaces.AnnotationHandlerBuilder):
         return annotation
 
     def is_done(self):
-        return self.remaining_args_count == 0
+        return not self._missing
 
     def copy(self):
         return self
 
     @property
     def _types(self):
+        # Iterate over the argument list, rather than the mapping, to
+        # preserve the order of the function's parameters.
         types = self._annotations
-        return ((k, types[k]) for k in types if types[k] is not None)
+        return ((k, types[k]) for k in self._arguments if types[k] is not None)
 
     def build(self):
         return ArgumentAnnotationHandler(
@@ -139,28 +168,47 @@ class ArgumentAnnotationHandler(interfaces.AnnotationHandler):
     def __init__(self, func, arguments):
         self._func = func
         self._arguments = arguments
+        self._annotations = tuple(arguments.values())
+        # Bind each annotation's request modifier upfront, so that
+        # handling a call doesn't need to resolve them again.
+        self._request_modifiers = tuple(
+            (name, arguments[name].modify_request) for name in arguments
+        )
+        self._get_call_args = utils.call_args_binder(func)
 
     @property
     def annotations(self):
-        return iter(self._arguments.values())
+        return self._annotations
 
-    def get_relevant_arguments(self, call_args):
-        annotations = self._arguments
-        return ((n, annotations[n]) for n in call_args if n in annotations)
+    def get_call_args(self, *args, **kwargs):
+        """
+        Maps the given arguments of a call to the handler's function
+        onto its parameter names.
+        """
+        return self._get_call_args(*args, **kwargs)
 
     def handle_call(self, request_builder, args, kwargs):
-        call_args = utils.get_call_args(self._func, None, *args, **kwargs)
+        call_args = self._get_call_args(None, *args, **kwargs)
         self.handle_call_args(request_builder, call_args)
 
     def handle_call_args(self, request_builder, call_args):
         # TODO: Catch Annotation errors and chain them here + provide context.
-        for name, annotation in self.get_relevant_arguments(call_args):
-            annotation.modify_request(request_builder, call_args[name])
+        get_value = call_args.get
+        for name, modify_request in self._request_modifiers:
+            value = get_value(name, _MISSING)
+            if value is not _MISSING:
+                modify_request(request_builder, value)
 
 
 class ArgumentAnnotation(interfaces.Annotation):
+    __slots__ = ("_converter",)
+
     _can_be_static = True
 
+    def __init__(self):
+        # The converter registry and the converter last resolved from it.
+        self._converter = (None, None)
+
     def __call__(self, request_definition_builder):
         request_definition_builder.argument_handler_builder.add_annotation(self)
         return request_definition_builder
@@ -176,15 +224,32 @@ class ArgumentAnnotation(interfaces.Annotation):
     def converter_key(self):  # pragma: no cover
         raise NotImplementedError
 
+    def _get_converter(self, request_builder):
+        registry = request_builder.converter_registry
+        try:
+            cached_registry, converter = self._converter
+        except AttributeError:
+            # Subclasses may override `__init__` without chaining to it.
+            cached_registry = converter = None
+        if registry is not cached_registry or registry is None:
+            argument_type, converter_key = self.type, self.converter_key
+            converter = request_builder.get_converter(
+                converter_key, argument_type
+            )
+            self._converter = (registry, converter)
+        return converter
+
     def modify_request(self, request_builder, value):
-        argument_type, converter_key = self.type, self.converter_key
-        converter = request_builder.get_converter(converter_key, argument_type)
+        converter = self._get_converter(request_builder)
         self._modify_request(request_builder, converter(value))
 
 
 class TypedArgument(ArgumentAnnotation):
+    __slots__ = ("_type",)
+
     def __init__(self, type=None):
         self._type = type
+        super(TypedArgument, self).__init__()
 
     @property
     def type(self):
@@ -203,10 +268,13 @@ class TypedArgument(ArgumentAnnotation):
 
 
 class NamedArgument(TypedArgument):
+    __slots__ = ("_arg_name", "_set")
+
     _can_be_static = True
 
     def __init__(self, name=None, type=None):
-        self._arg_name = name
+        self._arg_name = name = _intern(name)
+        self._set = self._make_setter(name)
         super(NamedArgument, self).__init__(type)
 
     @property
@@ -216,16 +284,32 @@ class NamedArgument(TypedArgument):
     @name.setter
     def name(self, name):
         if self._arg_name is None:
-            self._arg_name = name
+            self._arg_name = name = _intern(name)
+            self._set = self._make_setter(name)
         else:
             raise AttributeError("Name is already set.")
 
+    def _make_setter(self, name):
+        """
+        Returns a callable that applies a value to a request builder
+        under the given name, or :obj:`None` if the subclass doesn't
+        use one.
+        """
+        return None
+
+    def _build_setter(self):
+        # Subclasses may override `__init__` without chaining to it.
+        self._set = setter = self._make_setter(self._arg_name)
+        return setter
+
     @property
     def converter_key(self):  # pragma: no cover
         raise NotImplementedError
 
 
 class EncodeNoneMixin(object):
+    __slots__ = ()
+
     #: Identifies how a `None` value should be encoded in the request.
     _encode_none = None  # type: str
 
@@ -243,6 +327,8 @@ class EncodeNoneMixin(object):
 
 
 class FuncDecoratorMixin(object):
+    __slots__ = ()
+
     @classmethod
     def _is_static_call(cls, *args_, **kwargs):
         if super(FuncDecoratorMixin, cls)._is_static_call(*args_, **kwargs):
@@ -310,6 +396,8 @@ class Path(NamedArgument):
             def get_todo(self, id): pass
     """
 
+    __slots__ = ()
+
     @property
     def converter_key(self):
         return keys.CONVERT_TO_STRING
@@ -370,6 +458,8 @@ class Query(FuncDecoratorMixin, EncodeNoneMixin, NamedArgument):
             parameters with a value of :py:obj:`None` will not be sent.
     """
 
+    __slots__ = ("_encoded", "_encode_none")
+
     class QueryStringEncodingError(exceptions.AnnotationError):
         message = "Failed to join encoded and unencoded query parameters."
 
@@ -391,7 +481,7 @@ class Query(FuncDecoratorMixin, EncodeNoneMixin, NamedArgument):
     @staticmethod
     def update_params(info, new_params, encoded):
         existing = info.setdefault("params", None if encoded else dict())
-        if encoded == isinstance(existing, collections.Mapping):
+        if encoded == isinstance(existing, _MAPPING_TYPES):
             raise Query.QueryStringEncodingError()
         Query._update_params(info, existing, new_params, encoded)
 
@@ -430,6 +520,8 @@ class QueryMap(FuncDecoratorMixin, TypedArgument):
             :py:obj:`name` and value are already URL encoded.
     """
 
+    __slots__ = ("_encoded",)
+
     def __init__(self, encoded=False, type=None):
         super(QueryMap, self).__init__(type)
         self._encoded = encoded
@@ -473,19 +565,30 @@ class Header(FuncDecoratorMixin, EncodeNoneMixin, NamedArgument):
         to the request.
     """
 
+    __slots__ = ()
+
     @property
     def converter_key(self):
         """Converts passed argument to string."""
         return keys.CONVERT_TO_STRING
 
+    def _make_setter(self, name):
+        return _make_info_setter("headers", name)
+
     def _modify_request(self, request_builder, value):
         """Updates request header contents."""
-        request_builder.info["headers"][self.name] = value
+        try:
+            set_ = self._set
+        except AttributeError:
+            set_ = self._build_setter()
+        set_(request_builder, value)
 
 
 class HeaderMap(FuncDecoratorMixin, TypedArgument):
     """Pass a mapping of header fields at runtime."""
 
+    __slots__ = ()
+
     @property
     def converter_key(self):
         """Converts every header field to string"""
@@ -514,6 +617,8 @@ class Field(NamedArgument):
                 \"""Update the current user.\"""
     """
 
+    __slots__ = ()
+
     class FieldAssignmentFailed(exceptions.AnnotationError):
         """Used if the field chosen failed to be defined."""
 
@@ -532,8 +637,14 @@ class Field(NamedArgument):
 
     def _modify_request(self, request_builder, value):
         """Updates the request body with chosen field."""
+        data = request_builder.info["data"]
+        # The body is usually a dict, unless another argument annotation
+        # has overwritten it, so only guard the assignment otherwise.
+        if type(data) is dict:
+            data[self.name] = value
+            return
         try:
-            request_builder.info["data"][self.name] = value
+            data[self.name] = value
         except TypeError:
             # TODO: re-raise with TypeError
             # `data` does not support item assignment
@@ -557,6 +668,8 @@ class FieldMap(TypedArgument):
                 \"""Update the current user.\"""
     """
 
+    __slots__ = ()
+
     class FieldMapUpdateFailed(exceptions.AnnotationError):
         """Use when the attempt to update the request body failed."""
 
@@ -572,8 +685,12 @@ class FieldMap(TypedArgument):
 
     def _modify_request(self, request_builder, value):
         """Updates request body with chosen field mapping."""
+        data = request_builder.info["data"]
+        if type(data) is dict:
+            data.update(value)
+            return
         try:
-            request_builder.info["data"].update(value)
+            data.update(value)
         except AttributeError:
             # TODO: re-raise with AttributeError
             raise self.FieldMapUpdateFailed()
@@ -595,14 +712,23 @@ class Part(NamedArgument):
                 \"""Upload a user profile photo.\"""
     """
 
+    __slots__ = ()
+
     @property
     def converter_key(self):
         """Converts part to the request body."""
         return keys.CONVERT_TO_REQUEST_BODY
 
+    def _make_setter(self, name):
+        return _make_info_setter("files", name)
+
     def _modify_request(self, request_builder, value):
         """Updates the request body with the form part."""
-        request_builder.info["files"][self.name] = value
+        try:
+            set_ = self._set
+        except AttributeError:
+            set_ = self._build_setter()
+        set_(request_builder, value)
 
 
 class PartMap(TypedArgument):
@@ -621,6 +747,8 @@ class PartMap(TypedArgument):
                 \"""Upload a user profile photo.\"""
     """
 
+    __slots__ = ()
+
     @property
     def converter_key(self):
         """Converts each part to the request body."""
@@ -648,6 +776,8 @@ class Body(TypedArgument):
                 \"""Update the current user.\"""
     """
 
+    __slots__ = ()
+
     @property
     def converter_key(self):
         """Converts request body."""
@@ -675,6 +805,8 @@ class Url(ArgumentAnnotation):
                 \"""Execute a GET requests against the given endpoint\"""
     """
 
+    __slots__ = ()
+
     class DynamicUrlAssignmentFailed(exceptions.InvalidRequestDefinition):
         """Raised when the attempt to set dynamic url fails."""
 
@@ -719,6 +851,8 @@ class Timeout(FuncDecoratorMixin, ArgumentAnnotation):
                 number of seconds.\"""
     """
 
+    __slots__ = ()
+
     @property
     def type(self):
         return float
@@ -778,6 +912,8 @@ class Context(FuncDecoratorMixin, NamedArgument):
         :ref:`here <annotating constructor arguments>`.
     """
 
+    __slots__ = ()
+
     @property
     def converter_key(self):
         """Do not convert passed argument."""
@@ -794,6 +930,8 @@ class ContextMap(FuncDecoratorMixin, ArgumentAnnotation):
     middleware at runtime.
     """
 
+    __slots__ = ()
+
     @property
     def converter_key(self):
         """Do not convert passed argument."""
@@ -801,7 +939,7 @@ class ContextMap(FuncDecoratorMixin, ArgumentAnnotation):
 
     def _modify_request(self, request_builder, value):
         """Updates the context with the given name-value pairs."""
-        if not isinstance(value, collections.Mapping):
+        if not isinstance(value, _MAPPING_TYPES):
             raise TypeError(
                 "ContextMap requires a mapping; got %s instead.", type(value)
             )
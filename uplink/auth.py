@@ -1,13 +1,10 @@
 """This module implements the auth layer."""
 
-# Standard library imports
-import collections
-
 # Third-party imports
 from requests import auth
 
 # Local imports
-from uplink import utils
+from uplink import compat, utils
 
 __all__ = [
     "ApiTokenParam",
@@ -22,7 +19,7 @@ __all__ = [
 def get_auth(auth_object=None):
     if auth_object is None:
         return utils.no_op
-    elif isinstance(auth_object, collections.Iterable):
+    elif isinstance(auth_object, compat.collections_abc.Iterable):
         return BasicAuth(*auth_object)
     elif callable(auth_object):
         return auth_object
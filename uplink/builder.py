@@ -13,7 +13,6 @@ from uplink import (
     hooks as hooks_,
     interfaces,
     session,
-    utils,
 )
 from uplink.clients import io
 
@@ -219,7 +218,7 @@ class ConsumerMeta(type):
             @functools.wraps(init)
             def new_init(self, *args, **kwargs):
                 init(self, *args, **kwargs)
-                call_args = utils.get_call_args(init, self, *args, **kwargs)
+                call_args = handler.get_call_args(self, *args, **kwargs)
                 f = functools.partial(
                     handler.handle_call_args, call_args=call_args
                 )
@@ -1,6 +1,3 @@
-# Standard library imports
-import collections
-
 # Local imports
 from uplink import compat
 
@@ -69,7 +66,7 @@ class SleepCallback(object):
         raise NotImplementedError
 
 
-class Executable(collections.Iterator):
+class Executable(compat.collections_abc.Iterator):
     """An abstraction for iterating over the execution of a request."""
 
     def __next__(self):
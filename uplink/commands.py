@@ -1,10 +1,10 @@
 # Standard library imports
-import collections
 import functools
 
 # Local imports
 from uplink import (
     arguments,
+    compat,
     converters,
     decorators,
     exceptions,
@@ -211,18 +211,22 @@ class RequestDefinitionBuilder(interfaces.RequestDefinitionBuilder):
         return builder
 
     def _auto_fill_remaining_arguments(self):
-        uri_vars = set(self.uri.remaining_variables)
-        missing = list(self.argument_handler_builder.missing_arguments)
-        still_missing = set(missing) - uri_vars
+        uri_vars = self.uri.remaining_variables
 
-        # Preserve order of function parameters.
-        matching = [p for p in missing if p in uri_vars]
+        # Split the missing arguments in a single pass, preserving the
+        # order of function parameters.
+        matching, still_missing = [], []
+        for name in self.argument_handler_builder.missing_arguments:
+            (matching if name in uri_vars else still_missing).append(name)
 
         if still_missing:
             raise MissingArgumentAnnotations(still_missing, matching)
 
-        path_vars = dict.fromkeys(matching, arguments.Path)
-        self.argument_handler_builder.set_annotations(path_vars)
+        # Add a named path annotation per match directly, rather than
+        # going through the generic `set_annotations` dispatch.
+        add_annotation = self.argument_handler_builder.add_annotation
+        for name in matching:
+            add_annotation(arguments.Path(name), name)
 
     def build(self):
         if not self._argument_handler_builder.is_done():
@@ -248,6 +252,7 @@ class RequestDefinition(interfaces.RequestDefinition):
         self._return_type = return_type
         self._argument_handler = argument_handler
         self._method_handler = method_handler
+        self._converter_registry = None
 
     @property
     def argument_annotations(self):
@@ -258,7 +263,14 @@ class RequestDefinition(interfaces.RequestDefinition):
         return tuple(self._method_handler.annotations)
 
     def make_converter_registry(self, converters_):
-        return converters.ConverterFactoryRegistry(converters_, self)
+        # Reuse the last registry while the converter chain is unchanged,
+        # so that annotations can cache the converters they resolve.
+        converters_ = tuple(converters_)
+        registry = self._converter_registry
+        if registry is None or tuple(registry.factories) != converters_:
+            registry = converters.ConverterFactoryRegistry(converters_, self)
+            self._converter_registry = registry
+        return registry
 
     def define_request(self, request_builder, func_args, func_kwargs):
         request_builder.method = self._method
@@ -304,7 +316,7 @@ class HttpMethod(object):
 
         # Register argument annotations
         if args:
-            is_map = isinstance(args, collections.Mapping)
+            is_map = isinstance(args, compat.collections_abc.Mapping)
             args, kwargs = ((), args) if is_map else (args, {})
             self._add_args = decorators.args(*args, **kwargs)
 
@@ -1,6 +1,14 @@
+# Standard library imports
+try:
+    from collections import abc as collections_abc
+except ImportError:  # pragma: no cover
+    # Python 2.7
+    import collections as collections_abc
+
 # Third-party imports
 import six
 
-__all__ = ["reraise"]
+__all__ = ["collections_abc", "intern", "reraise"]
 
+intern = six.moves.intern
 reraise = six.reraise
@@ -1,7 +1,5 @@
-# Standard library imports
-import collections
-
 # Local imports
+from uplink import compat
 from uplink._extras import installer, plugin
 from uplink.converters import keys
 from uplink.converters.interfaces import Factory, ConverterFactory, Converter
@@ -55,7 +53,7 @@ class ConverterChain(object):
         return converter
 
 
-class ConverterFactoryRegistry(collections.Mapping):
+class ConverterFactoryRegistry(compat.collections_abc.Mapping):
     """
     A registry that chains together
     :py:class:`interfaces.ConverterFactory` instances.
@@ -1,5 +1,6 @@
 # Standard library imports
 import collections
+import operator
 
 # Local imports
 from uplink import interfaces, utils
@@ -80,18 +81,19 @@ class RequestBuilder(object):
     def relative_url(self, url):
         self._relative_url_template = utils.URIBuilder(url)
 
-    @property
-    def info(self):
-        return self._info
-
-    @property
-    def context(self):
-        return self._context
+    # Argument annotations read these on every request, so use C-level
+    # getters rather than Python functions to avoid an extra call frame.
+    info = property(operator.attrgetter("_info"))
+    context = property(operator.attrgetter("_context"))
 
     @property
     def transaction_hooks(self):
         return iter(self._transaction_hooks)
 
+    @property
+    def converter_registry(self):
+        return self._converter_registry
+
     def get_converter(self, converter_key, *args, **kwargs):
         return self._converter_registry[converter_key](*args, **kwargs)
 
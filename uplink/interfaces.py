@@ -9,6 +9,8 @@ class AnnotationMeta(type):
 
 
 class _Annotation(object):
+    __slots__ = ()
+
     _can_be_static = False
 
     def modify_request_definition(self, request_definition_builder):
@@ -24,7 +26,7 @@ class _Annotation(object):
             return is_builder and not (kwargs or args[1:])
 
 
-Annotation = AnnotationMeta("Annotation", (_Annotation,), {})
+Annotation = AnnotationMeta("Annotation", (_Annotation,), {"__slots__": ()})
 
 
 class AnnotationHandlerBuilder(object):
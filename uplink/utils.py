@@ -1,5 +1,6 @@
 # Standard library imports
 import collections
+import functools
 import inspect
 
 try:
@@ -21,28 +22,85 @@ except ImportError:  # pragma: no cover
             args.append(arg_spec.keywords)
         return Signature(args, {}, None)
 
+    def call_args_binder(f):
+        return functools.partial(get_call_args, f)
+
 
 else:  # pragma: no cover
 
-    def get_call_args(f, *args, **kwargs):
+    def call_args_binder(f):
+        """
+        Returns a callable that maps the positional and keyword
+        arguments of a call to ``f`` onto its parameter names.
+
+        The function's signature is inspected once, upfront, so that
+        the returned callable can be invoked repeatedly without
+        reflecting on ``f`` each time. If ``f`` only has regular
+        positional-or-keyword parameters, the callable maps arguments
+        directly onto parameter names and falls back to binding the
+        signature only for calls it can't map (e.g., invalid calls).
+        Either way, the result is an ordered mapping that follows the
+        order of ``f``'s parameters.
+        """
         sig = signature(f)
-        arguments = sig.bind(*args, **kwargs).arguments
-        # apply defaults:
-        new_arguments = []
+        missing, var_keyword = object(), object()
+        fallbacks = []
         for name, param in sig.parameters.items():
-            try:
-                new_arguments.append((name, arguments[name]))
-            except KeyError:
-                if param.default is not param.empty:
-                    val = param.default
-                elif param.kind is param.VAR_POSITIONAL:
-                    val = ()
-                elif param.kind is param.VAR_KEYWORD:
-                    val = {}
-                else:
-                    continue
-                new_arguments.append((name, val))
-        return collections.OrderedDict(new_arguments)
+            if param.default is not param.empty:
+                val = param.default
+            elif param.kind is param.VAR_POSITIONAL:
+                val = ()
+            elif param.kind is param.VAR_KEYWORD:
+                # Create a new dict per call, as callers may mutate it.
+                val = var_keyword
+            else:
+                val = missing
+            fallbacks.append((name, val))
+        fallbacks = tuple(fallbacks)
+        bind = sig.bind
+
+        def get_call_args_(*args, **kwargs):
+            arguments = bind(*args, **kwargs).arguments
+            # apply defaults:
+            new_arguments = []
+            for name, val in fallbacks:
+                try:
+                    new_arguments.append((name, arguments[name]))
+                except KeyError:
+                    if val is var_keyword:
+                        new_arguments.append((name, {}))
+                    elif val is not missing:
+                        new_arguments.append((name, val))
+            return collections.OrderedDict(new_arguments)
+
+        params = sig.parameters.values()
+        if any(p.kind is not p.POSITIONAL_OR_KEYWORD for p in params):
+            return get_call_args_
+
+        names, size = tuple(sig.parameters), len(fallbacks)
+
+        def get_positional_call_args(*args, **kwargs):
+            count, used = len(args), 0
+            call_args = collections.OrderedDict(zip(names, args))
+            for name, val in fallbacks[count:]:
+                if name in kwargs:
+                    val = kwargs[name]
+                    used += 1
+                elif val is missing:
+                    break
+                call_args[name] = val
+            else:
+                if count <= size and used == len(kwargs):
+                    return call_args
+            # Let the signature report what's wrong with the call.
+            return get_call_args_(*args, **kwargs)
+
+        return get_positional_call_args
+
+    def get_call_args(f, *args, **kwargs):
+        # Compatibility shim: this inspects `f` on every call, so prefer
+        # reusing a binder from `call_args_binder` for repeated calls.
+        return call_args_binder(f)(*args, **kwargs)
 
     def get_arg_spec(f):
         sig = signature(f)